@@ -0,0 +1,252 @@
+"""
+6502 CPU core. Pure Python apart from the optional Numba kernel, so it runs
+unchanged under PyPy with neither numpy nor Numba installed.
+"""
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; only the Numba kernel needs it
+    np = None
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; CPU.run() falls back to CPU.step()
+    njit = None
+
+# Base cycle count per opcode; anything not listed is timed like NOP
+OPCODE_CYCLES = {0x00: 7, 0x4C: 3, 0x8D: 4}
+CYCLES = bytes(OPCODE_CYCLES.get(opcode, 2) for opcode in range(256))
+
+# Zero/Negative status bits for every byte value, for the packed-status kernel:
+# status = (status & 0x7D) | NZ[v]
+NZ = bytes((0x02 if v == 0 else 0) | (v & 0x80) for v in range(256))
+
+# --- Numba CPU Core ---
+def _jit(func):
+    return njit(cache=True)(func) if njit is not None else func
+
+if np is not None:
+    _CYCLE_TABLE = np.frombuffer(CYCLES, dtype=np.uint8)
+    _NZ_TABLE = np.frombuffer(NZ, dtype=np.uint8)
+else:
+    _CYCLE_TABLE, _NZ_TABLE = CYCLES, NZ
+
+@_jit
+def _bus_read(ram, prg_view, address):
+    if address >= 0x8000:
+        return prg_view[address & 0x7FFF]
+    if address < 0x2000:
+        return ram[address & 0x7FF]
+    return 0
+
+@_jit
+def run_cycles(regs, ram, prg_view, n):
+    """
+    Execute opcodes natively until at least n cycles have elapsed and return
+    the cycle count. regs is [A, X, Y, SP, PC, status] and is updated in
+    place; opcode semantics mirror CPU.step().
+    """
+    a, x, y, pc, status = regs[0], regs[1], regs[2], regs[4], regs[5]
+    cycles = 0
+    while cycles < n:
+        opcode = _bus_read(ram, prg_view, pc)
+        pc = (pc + 1) & 0xFFFF
+        cycles += _CYCLE_TABLE[opcode]
+
+        if opcode == 0xA9:  # LDA immediate
+            a = _bus_read(ram, prg_view, pc)
+            pc = (pc + 1) & 0xFFFF
+            status = (status & 0x7D) | _NZ_TABLE[a]
+        elif opcode == 0xA2:  # LDX immediate
+            x = _bus_read(ram, prg_view, pc)
+            pc = (pc + 1) & 0xFFFF
+            status = (status & 0x7D) | _NZ_TABLE[x]
+        elif opcode == 0xA0:  # LDY immediate
+            y = _bus_read(ram, prg_view, pc)
+            pc = (pc + 1) & 0xFFFF
+            status = (status & 0x7D) | _NZ_TABLE[y]
+        elif opcode == 0x8D:  # STA absolute
+            lo = _bus_read(ram, prg_view, pc)
+            hi = _bus_read(ram, prg_view, (pc + 1) & 0xFFFF)
+            addr = lo | (hi << 8)
+            pc = (pc + 2) & 0xFFFF
+            if addr < 0x2000:
+                ram[addr & 0x7FF] = a
+        elif opcode == 0x4C:  # JMP absolute
+            lo = _bus_read(ram, prg_view, pc)
+            hi = _bus_read(ram, prg_view, (pc + 1) & 0xFFFF)
+            target = lo | (hi << 8)
+            if target == pc - 1 and cycles < n:  # Self-jump: skip the idle spin
+                cycles += (n - cycles + 2) // 3 * 3
+            pc = target
+        elif opcode == 0xE8:  # INX
+            x = (x + 1) & 0xFF
+            status = (status & 0x7D) | _NZ_TABLE[x]
+        elif opcode == 0xCA:  # DEX
+            x = (x - 1) & 0xFF
+            status = (status & 0x7D) | _NZ_TABLE[x]
+        # NOP, BRK and unimplemented opcodes fall through
+
+    regs[0], regs[1], regs[2], regs[4], regs[5] = a, x, y, pc, status
+    return cycles
+
+# --- Opcode Handler Templates ---
+# Implemented opcodes as (mnemonic, addressing mode); anything else, BRK
+# included for now, runs as NOP
+OPCODES = {
+    0xA9: ("lda", "imm"),  # LDA immediate
+    0xA2: ("ldx", "imm"),  # LDX immediate
+    0xA0: ("ldy", "imm"),  # LDY immediate
+    0x8D: ("sta", "abs"),  # STA absolute
+    0x4C: ("jmp", "abs"),  # JMP absolute
+    0xE8: ("inx", "imp"),  # INX
+    0xCA: ("dex", "imp"),  # DEX
+    0xEA: ("nop", "imp"),  # NOP
+}
+
+# Handler source is stitched together per opcode and exec'd once at import.
+# PC already points past the opcode byte; operand length and whether the
+# opcode jumps are fixed at generation time, so handlers are straight-line code.
+_HANDLER_TEMPLATE = "def op_{mnem}_{mode}(cpu):\n{fetch}{advance}{body}"
+# Operand fetches inline Memory's PRG fast paths and only call into Memory
+# when PC is outside $8000-$FFFE.
+_FETCH = {
+    "imp": "",
+    "imm": (
+        "    pc = cpu.PC\n"
+        "    memory = cpu.memory\n"
+        "    value = memory.prg_view[pc & 0x7FFF] if pc >= 0x8000 else memory.read(pc)\n"
+    ),
+    "abs": (
+        "    pc = cpu.PC\n"
+        "    memory = cpu.memory\n"
+        "    addr = memory.prg_words[pc & 0x7FFF] if 0x8000 <= pc < 0xFFFF else memory.read_word(pc)\n"
+    ),
+}
+_LENGTH = {"imp": 0, "imm": 1, "abs": 2}
+_JUMPS = {"jmp"}
+_BODY = {
+    "lda": "    cpu.A = value\n    cpu.Z = value == 0\n    cpu.N = value > 0x7F\n",
+    "ldx": "    cpu.X = value\n    cpu.Z = value == 0\n    cpu.N = value > 0x7F\n",
+    "ldy": "    cpu.Y = value\n    cpu.Z = value == 0\n    cpu.N = value > 0x7F\n",
+    "sta": "    memory.write(addr, cpu.A)\n",
+    "jmp": (
+        # A JMP to itself spins until the batch ends; fast-forward over the
+        # remaining 3-cycle iterations instead of dispatching each one
+        "    if addr == pc - 1:\n"
+        "        idle = cpu.next_event - cpu.cycles - 3\n"
+        "        if idle > 0:\n"
+        "            cpu.cycles += (idle + 2) // 3 * 3\n"
+        "    cpu.PC = addr\n"
+    ),
+    "inx": "    x = (cpu.X + 1) & 0xFF\n    cpu.X = x\n    cpu.Z = x == 0\n    cpu.N = x > 0x7F\n",
+    "dex": "    x = (cpu.X - 1) & 0xFF\n    cpu.X = x\n    cpu.Z = x == 0\n    cpu.N = x > 0x7F\n",
+    "nop": "    pass\n",
+}
+
+# Status register bit -> CPU flag attribute, for set_flag()/get_flag()
+_FLAG_ATTRS = {0x01: 'C', 0x02: 'Z', 0x04: 'I', 0x08: 'D', 0x40: 'V', 0x80: 'N'}
+
+# --- CPU Skeleton (6502 Subset) ---
+class CPU:
+    __slots__ = ('memory', 'PC', 'A', 'X', 'Y', 'SP', 'C', 'Z', 'I', 'D', 'V', 'N', 'cycles', 'next_event')
+
+    def __init__(self, memory):
+        self.memory = memory
+        self.PC = self.memory.read_word(0xFFFC)
+        self.A = 0
+        self.X = 0
+        self.Y = 0
+        self.SP = 0xFD
+        # Processor status as one attribute per flag; `status` packs them on demand
+        self.C = False  # Carry
+        self.Z = False  # Zero
+        self.I = True  # IRQ disabled
+        self.D = False  # Decimal
+        self.V = False  # Overflow
+        self.N = False  # Negative
+        self.cycles = 0
+        self.next_event = 0  # cycle count the current run() batch ends at
+
+    @property
+    def status(self):
+        return self._pack_status()
+
+    @status.setter
+    def status(self, value):
+        self._unpack_status(value)
+
+    def _pack_status(self):
+        # Bit 5 always reads back set; B only exists in copies pushed by PHP/BRK
+        return (0x20 | (self.N << 7) | (self.V << 6) | (self.D << 3)
+                | (self.I << 2) | (self.Z << 1) | self.C)
+
+    def _unpack_status(self, value):
+        self.N = bool(value & 0x80)
+        self.V = bool(value & 0x40)
+        self.D = bool(value & 0x08)
+        self.I = bool(value & 0x04)
+        self.Z = bool(value & 0x02)
+        self.C = bool(value & 0x01)
+
+    def set_flag(self, flag, value):
+        # flag is a single status bit; it maps straight to its attribute
+        setattr(self, _FLAG_ATTRS[flag], bool(value))
+
+    def get_flag(self, flag):
+        return getattr(self, _FLAG_ATTRS[flag])
+
+    def push(self, value):
+        self.memory.stack[self.SP] = value & 0xFF
+        self.SP = (self.SP - 1) & 0xFF
+
+    def pull(self):
+        self.SP = (self.SP + 1) & 0xFF
+        return self.memory.stack[self.SP]
+
+    def step(self):
+        opcode = self.memory.read(self.PC)
+        self.PC = (self.PC + 1) & 0xFFFF
+        self._ops[opcode](self)
+        self.cycles += CYCLES[opcode]
+
+    def run(self, n):
+        """Run for n more cycles, through the Numba kernel when it is installed."""
+        self.next_event += n
+        if njit is None:
+            while self.cycles < self.next_event:
+                self.step()
+            return
+        # Zero-copy uint8 views; the kernel writes RAM through to the bytearray
+        ram = np.frombuffer(self.memory.ram, dtype=np.uint8)
+        prg_view = np.frombuffer(self.memory.prg_view, dtype=np.uint8)
+        regs = np.array([self.A, self.X, self.Y, self.SP, self.PC, self.status], dtype=np.int32)
+        self.cycles += run_cycles(regs, ram, prg_view, self.next_event - self.cycles)
+        self.A, self.X, self.Y, self.SP, self.PC, self.status = regs.tolist()
+
+    @classmethod
+    def _build_ops(cls):
+        """Generate one handler per opcode and install the 256-entry dispatch table."""
+        namespace = {}
+        for mnem, mode in set(OPCODES.values()):
+            length = _LENGTH[mode]
+            advance = ""
+            if length and mnem not in _JUMPS:
+                advance = "    cpu.PC = (pc + %d) & 0xFFFF\n" % length
+            source = _HANDLER_TEMPLATE.format(
+                mnem=mnem, mode=mode, fetch=_FETCH[mode], advance=advance, body=_BODY[mnem]
+            )
+            exec(source, namespace)
+        nop = namespace["op_nop_imp"]
+        cls._ops = tuple(
+            namespace["op_%s_%s" % OPCODES[opcode]] if opcode in OPCODES else nop
+            for opcode in range(256)
+        )
+
+CPU._build_ops()
+
+# Prefer the compiled core when it has been built (python setup.py build_ext --inplace);
+# cpu_core provides Memory and CPU together, so both modules switch or neither does
+try:
+    from cpu_core import CPU
+except ImportError:
+    pass
@@ -0,0 +1,196 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+Compiled 6502 core: drop-in replacements for memory.Memory and cpu.CPU with
+C-typed registers and typed memoryviews over RAM and PRG-ROM. The buffers
+are the same plain bytearray/bytes/array objects memory.Memory exposes, and
+the C/Z/I/D/V/N flags are properties over the packed status byte.
+
+Build in place with:  python setup.py build_ext --inplace
+"""
+from array import array
+
+# --- NES Constants ---
+RAM_SIZE = 0x800  # 2KB internal RAM
+
+# Base cycle count per opcode (anything not listed is timed like NOP) and
+# the Zero/Negative status bits for every byte value
+cdef unsigned char CYCLES[256]
+cdef unsigned char NZ[256]
+cdef int _v
+for _v in range(256):
+    CYCLES[_v] = 2
+    NZ[_v] = (0x02 if _v == 0 else 0) | (_v & 0x80)
+CYCLES[0x00] = 7
+CYCLES[0x4C] = 3
+CYCLES[0x8D] = 4
+
+# --- Memory Map ---
+cdef class Memory:
+    cdef public object ram, stack, prg_rom, prg_view, prg_words
+    cdef unsigned char[::1] _ram, _stack
+    cdef const unsigned char[::1] _prg
+    cdef const unsigned short[::1] _words
+
+    def __init__(self, prg_rom):
+        self.ram = bytearray(RAM_SIZE)
+        self.stack = memoryview(self.ram)[0x100:0x200]  # Page one as a view, indexed by SP
+        self.prg_rom = bytes(prg_rom)
+        # 32 KiB window for $8000-$FFFF; 16 KiB carts are repeated to fill it
+        prg = self.prg_rom or bytes(1)
+        self.prg_view = (prg * (0x8000 // len(prg) + 1))[:0x8000]
+        view = self.prg_view
+        self.prg_words = array('H', [view[i] | (view[i + 1] << 8) for i in range(0x7FFF)])
+        self._ram = self.ram
+        self._stack = self.stack
+        self._prg = self.prg_view
+        self._words = self.prg_words
+
+    cpdef unsigned char read(self, unsigned int address):
+        if address >= 0x8000:
+            return self._prg[address & 0x7FFF]
+        if address < 0x2000:
+            return self._ram[address & 0x7FF]
+        return 0
+
+    cpdef void write(self, unsigned int address, int value):
+        if address < 0x2000:
+            self._ram[address & 0x7FF] = value & 0xFF
+
+    cpdef unsigned int read_word(self, unsigned int address):
+        cdef unsigned int lo = self.read(address)
+        cdef unsigned int hi = self.read((address + 1) & 0xFFFF)
+        return (hi << 8) | lo
+
+    cpdef unsigned int read_word_fast(self, unsigned int address):
+        if 0x8000 <= address < 0xFFFF:
+            return self._words[address & 0x7FFF]
+        return self.read_word(address)
+
+# --- CPU Skeleton (6502 Subset) ---
+cdef class CPU:
+    cdef public Memory memory
+    cdef public unsigned short PC
+    cdef public unsigned char A, X, Y, SP, status
+    cdef public long long cycles, next_event
+
+    def __init__(self, Memory memory):
+        self.memory = memory
+        self.PC = self.memory.read_word(0xFFFC)
+        self.A = 0
+        self.X = 0
+        self.Y = 0
+        self.SP = 0xFD
+        self.status = 0x24  # IRQ disabled
+        self.cycles = 0
+        self.next_event = 0  # cycle count the current run() batch ends at
+
+    # Per-flag views of status, matching cpu.CPU's flag attributes
+    @property
+    def C(self):
+        return (self.status & 0x01) != 0
+
+    @C.setter
+    def C(self, bint value):
+        self.set_flag(0x01, value)
+
+    @property
+    def Z(self):
+        return (self.status & 0x02) != 0
+
+    @Z.setter
+    def Z(self, bint value):
+        self.set_flag(0x02, value)
+
+    @property
+    def I(self):
+        return (self.status & 0x04) != 0
+
+    @I.setter
+    def I(self, bint value):
+        self.set_flag(0x04, value)
+
+    @property
+    def D(self):
+        return (self.status & 0x08) != 0
+
+    @D.setter
+    def D(self, bint value):
+        self.set_flag(0x08, value)
+
+    @property
+    def V(self):
+        return (self.status & 0x40) != 0
+
+    @V.setter
+    def V(self, bint value):
+        self.set_flag(0x40, value)
+
+    @property
+    def N(self):
+        return (self.status & 0x80) != 0
+
+    @N.setter
+    def N(self, bint value):
+        self.set_flag(0x80, value)
+
+    cpdef void set_flag(self, unsigned char flag, bint value):
+        if value:
+            self.status |= flag
+        else:
+            self.status &= ~flag
+
+    cpdef bint get_flag(self, unsigned char flag):
+        return (self.status & flag) != 0
+
+    cpdef void push(self, int value):
+        self.memory._stack[self.SP] = value & 0xFF
+        self.SP = (self.SP - 1) & 0xFF
+
+    cpdef unsigned char pull(self):
+        self.SP = (self.SP + 1) & 0xFF
+        return self.memory._stack[self.SP]
+
+    cpdef void step(self):
+        cdef unsigned char opcode = self.memory.read(self.PC)
+        cdef unsigned int addr
+        cdef long long idle
+        self.PC = (self.PC + 1) & 0xFFFF
+
+        if opcode == 0xA9:  # LDA immediate
+            self.A = self.memory.read(self.PC)
+            self.PC = (self.PC + 1) & 0xFFFF
+            self.status = (self.status & 0x7D) | NZ[self.A]
+        elif opcode == 0xA2:  # LDX immediate
+            self.X = self.memory.read(self.PC)
+            self.PC = (self.PC + 1) & 0xFFFF
+            self.status = (self.status & 0x7D) | NZ[self.X]
+        elif opcode == 0xA0:  # LDY immediate
+            self.Y = self.memory.read(self.PC)
+            self.PC = (self.PC + 1) & 0xFFFF
+            self.status = (self.status & 0x7D) | NZ[self.Y]
+        elif opcode == 0x8D:  # STA absolute
+            addr = self.memory.read_word_fast(self.PC)
+            self.PC = (self.PC + 2) & 0xFFFF
+            self.memory.write(addr, self.A)
+        elif opcode == 0x4C:  # JMP absolute
+            addr = self.memory.read_word_fast(self.PC)
+            if addr + 1 == <unsigned int>self.PC:  # Self-jump: skip the idle spin
+                idle = self.next_event - self.cycles - 3
+                if idle > 0:
+                    self.cycles += (idle + 2) // 3 * 3
+            self.PC = addr
+        elif opcode == 0xE8:  # INX
+            self.X = (self.X + 1) & 0xFF
+            self.status = (self.status & 0x7D) | NZ[self.X]
+        elif opcode == 0xCA:  # DEX
+            self.X = (self.X - 1) & 0xFF
+            self.status = (self.status & 0x7D) | NZ[self.X]
+        # NOP, BRK and unimplemented opcodes fall through
+
+        self.cycles += CYCLES[opcode]
+
+    cpdef void run(self, long long n):
+        """Run for n more cycles."""
+        self.next_event += n
+        while self.cycles < self.next_event:
+            self.step()
@@ -0,0 +1,129 @@
+"""
+Tk display and frame pacing shared by the EMU*.py front ends, which only
+add their own window chrome and ROM selection on top.
+"""
+import time
+import tkinter as tk
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; Screen.show() falls back to bytes slicing
+    np = None
+
+from cpu import CPU
+from memory import Memory
+from ppu import PPU, SCREEN_WIDTH, SCREEN_HEIGHT
+
+# --- Emulation Timing ---
+CYCLES_PER_FRAME = 29780  # NTSC CPU cycles per video frame
+FRAME_TIME = 1 / 60  # Seconds per video frame
+MAX_FRAMESKIP = 4  # Draw at least one frame in every MAX_FRAMESKIP + 1
+
+# Binary PPM header; Tk parses header + raw RGB bytes straight into the photo
+PPM_HEADER = b"P6\n%d %d\n255\n" % (SCREEN_WIDTH, SCREEN_HEIGHT)
+
+# --- NES Screen ---
+class Screen(tk.Canvas):
+    """Canvas that shows PPU frames at twice the native resolution."""
+
+    def __init__(self, master, **options):
+        super().__init__(master, width=SCREEN_WIDTH * 2, height=SCREEN_HEIGHT * 2, **options)
+        # Frames land in base_image at native resolution and Tk's C-level
+        # "copy -zoom" doubles them into display_image, which the canvas shows
+        self.base_image = tk.PhotoImage(width=SCREEN_WIDTH, height=SCREEN_HEIGHT)
+        self.display_image = self.base_image.zoom(2, 2)
+        # One PPM buffer for the whole session; each frame's pixels are copied
+        # in behind the fixed header instead of building a new image
+        self.ppm = bytearray(PPM_HEADER) + bytearray(SCREEN_WIDTH * SCREEN_HEIGHT * 3)
+        if np is not None:
+            # Flat uint8 view of the pixel area, written in place by show()
+            self.ppm_pixels = np.frombuffer(self.ppm, dtype=np.uint8, offset=len(PPM_HEADER))
+        self.shown_generation = None  # PPU.generation of the frame on screen
+        self.img_on_canvas = self.create_image(0, 0, image=self.display_image, anchor=tk.NW)
+
+    def show(self, frame, generation):
+        # The PPU bumps generation whenever its frame changes; anything else is
+        # already on screen, so there is nothing to convert or upload
+        if generation == self.shown_generation:
+            return
+        self.shown_generation = generation
+        # Frames are packed RGBA; drop alpha while filling in the PPM pixels
+        if np is not None:
+            rgba = frame.view(np.uint8).reshape(-1, 4)
+            pixels = self.ppm_pixels
+            pixels[0::3] = rgba[:, 0]
+            pixels[1::3] = rgba[:, 1]
+            pixels[2::3] = rgba[:, 2]
+        else:
+            start = len(PPM_HEADER)
+            self.ppm[start::3] = frame[0::4]
+            self.ppm[start + 1::3] = frame[1::4]
+            self.ppm[start + 2::3] = frame[2::4]
+        # Tk needs bytes (a bytearray would be passed as a string); the canvas
+        # item already shows display_image, so updating the photo is enough
+        self.base_image.configure(data=bytes(self.ppm), format="PPM")
+        self.display_image.tk.call(self.display_image, "copy", self.base_image, "-zoom", 2, 2)
+
+# --- Frame Loop ---
+class FrameLoop:
+    """
+    Runs the loaded ROM one video frame per Tk callback: a CPU batch, then
+    a blit to `screen`, on a drift-free clock with bounded frameskip.
+    """
+
+    def __init__(self, root, screen):
+        self.root = root
+        self.screen = screen
+        self.memory = None
+        self.cpu = None
+        self.ppu = None
+        self.running = False
+        self.emulate_id = None
+
+    def load(self, prg_rom, chr_rom):
+        # Stop the previous ROM's loop so only one emulate chain is scheduled
+        if self.emulate_id is not None:
+            self.root.after_cancel(self.emulate_id)
+            self.emulate_id = None
+        self.memory = Memory(prg_rom)
+        self.cpu = CPU(self.memory)
+        self.ppu = PPU(chr_rom)
+        self.screen.shown_generation = None  # Generations are per PPU; redraw the first frame
+
+    def start(self):
+        self.running = True
+        self.emulate()
+
+    def emulate(self):
+        # Anchor the frame clock now; every later deadline is relative to it
+        self.next_frame = time.perf_counter()
+        self.frames_skipped = 0
+        self._tick_frame()
+
+    def _tick_cpu(self):
+        self.cpu.run(CYCLES_PER_FRAME)
+
+    def _tick_frame(self):
+        if not self.running:
+            return
+        self._tick_cpu()
+        self.next_frame += FRAME_TIME
+
+        # Skip the blit when the CPU batch overran this frame's slot, but never
+        # more than MAX_FRAMESKIP frames in a row
+        now = time.perf_counter()
+        if now <= self.next_frame or self.frames_skipped >= MAX_FRAMESKIP:
+            frame = self.ppu.render_frame()
+            self.screen.show(frame, self.ppu.generation)
+            self.frames_skipped = 0
+            now = time.perf_counter()
+        else:
+            self.frames_skipped += 1
+
+        if now - self.next_frame > MAX_FRAMESKIP * FRAME_TIME:
+            self.next_frame = now  # Too far behind to catch up; resync the clock
+        delay = int((self.next_frame - now) * 1000)
+        if delay > 0:
+            self.emulate_id = self.root.after(delay, self._tick_frame)
+        else:
+            self.emulate_id = self.root.after_idle(self._tick_frame)
@@ -0,0 +1,41 @@
+"""
+iNES ROM loader, shared by the emulator front ends. Standard library only.
+"""
+import functools
+import mmap
+import os
+import struct
+
+# --- iNES ROM Loader ---
+def load_ines_rom(filename):
+    """
+    Return (prg_rom, chr_rom) for an iNES file. Parsed ROMs are shared
+    process-wide and keyed on (path, mtime, size), so reopening an unchanged
+    file costs one stat() and editing it on disk forces a reload.
+    """
+    st = os.stat(filename)
+    return _load_ines_rom(os.path.abspath(filename), st.st_mtime_ns, st.st_size)
+
+@functools.lru_cache(maxsize=32)
+def _load_ines_rom(filename, mtime_ns, size):
+    # PRG/CHR are cached as bytes copies and the mapping is closed before
+    # returning, so no file stays mapped (and locked, on Windows) while cached.
+    # bytes are immutable, so cached ROMs are safe to share.
+    if size < 16:
+        raise ValueError("Not a valid iNES ROM file.")
+    with open(filename, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as rom:
+        magic, prg_banks, chr_banks, flags6 = struct.unpack_from("<4sBBB", rom)
+        if magic != b"NES\x1a":
+            raise ValueError("Not a valid iNES ROM file.")
+
+        prg_rom_size = prg_banks * 16 * 1024
+        chr_rom_size = chr_banks * 8 * 1024
+
+        # Skip trainer if present
+        offset = 16 + (512 if flags6 & 0x04 else 0)
+        if offset + prg_rom_size + chr_rom_size > size:
+            raise ValueError("iNES ROM file is truncated.")
+
+        prg_rom = rom[offset:offset + prg_rom_size]
+        chr_rom = rom[offset + prg_rom_size:offset + prg_rom_size + chr_rom_size]
+    return prg_rom, chr_rom
@@ -0,0 +1,54 @@
+"""
+NES CPU memory map. Plain Python buffers only, so the module runs (and
+traces well) under PyPy; numpy is not needed here.
+"""
+from array import array
+
+# --- NES Constants ---
+RAM_SIZE = 0x800  # 2KB internal RAM
+
+# --- Memory Map ---
+class Memory:
+    __slots__ = ('ram', 'stack', 'prg_rom', 'prg_view', 'prg_words')
+
+    def __init__(self, prg_rom):
+        # Indexing bytes, bytearray and array always yields plain ints, so
+        # 16-bit address math never wraps at uint8
+        self.ram = bytearray(RAM_SIZE)
+        self.stack = memoryview(self.ram)[0x100:0x200]  # Page one as a view, indexed by SP
+        self.prg_rom = bytes(prg_rom)
+        # 32 KiB window for $8000-$FFFF; 16 KiB carts are repeated to fill it
+        prg = self.prg_rom or bytes(1)
+        self.prg_view = (prg * (0x8000 // len(prg) + 1))[:0x8000]
+        # Little-endian word at every PRG offset but the last (whose high byte
+        # lives at $0000), so absolute operands are fetched with one lookup
+        view = self.prg_view
+        self.prg_words = array('H', [view[i] | (view[i + 1] << 8) for i in range(0x7FFF)])
+
+    def read(self, address):
+        if address >= 0x8000:
+            return self.prg_view[address & 0x7FFF]
+        if address < 0x2000:
+            return self.ram[address & 0x7FF]
+        return 0
+
+    def write(self, address, value):
+        if address < 0x2000:
+            self.ram[address & 0x7FF] = value & 0xFF
+
+    def read_word(self, address):
+        lo = self.read(address)
+        hi = self.read((address + 1) & 0xFFFF)
+        return (hi << 8) | lo
+
+    def read_word_fast(self, address):
+        if 0x8000 <= address < 0xFFFF:
+            return self.prg_words[address & 0x7FFF]
+        return self.read_word(address)
+
+# Prefer the compiled core when it has been built (python setup.py build_ext --inplace);
+# cpu_core provides Memory and CPU together, so both modules switch or neither does
+try:
+    from cpu_core import Memory
+except ImportError:
+    pass
@@ -0,0 +1,68 @@
+"""
+NES PPU. Tile decoding and background rendering use numpy when it is
+installed; without it (e.g. a bare PyPy) frames are plain black bytes.
+Frames are packed RGBA, one little-endian uint32 (0xAABBGGRR) per pixel.
+"""
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; render_frame() still works without it
+    np = None
+
+SCREEN_WIDTH, SCREEN_HEIGHT = 256, 240
+
+# --- PPU Skeleton ---
+class PPU:
+    __slots__ = ('chr_rom', 'tile_cache', 'frame32', '_black', 'generation', '_last_frame')
+
+    def __init__(self, chr_rom):
+        self.chr_rom = chr_rom
+        self.frame32 = None  # Allocated once real rendering writes pixels
+        # Bumped whenever a returned frame differs from the previous one, so
+        # the display can skip uploading a frame it already shows
+        self.generation = 0
+        self._last_frame = None
+        if np is None:
+            self.tile_cache = None
+            self._black = bytes(SCREEN_HEIGHT * SCREEN_WIDTH * 4)
+            return
+        # Decode the CHR bitplanes once into (tiles, 8, 8) 2-bit colour indices:
+        # each 16-byte tile is 8 rows of plane 0 followed by 8 rows of plane 1
+        data = np.frombuffer(chr_rom, dtype=np.uint8)
+        planes = data[:data.size - data.size % 16].reshape(-1, 16)
+        shifts = np.arange(7, -1, -1, dtype=np.uint8)
+        low = (planes[:, :8, None] >> shifts) & 1
+        high = (planes[:, 8:, None] >> shifts) & 1
+        self.tile_cache = low | (high << 1)
+        self._black = np.zeros((SCREEN_HEIGHT, SCREEN_WIDTH), dtype='<u4')
+        self._black.setflags(write=False)
+
+    def render_frame(self):
+        # TODO: Implement background and sprite rendering
+        return self._present(self._black, False)  # Black screen for now; shared, read-only buffer
+
+    def _present(self, frame, redrawn):
+        if redrawn or frame is not self._last_frame:
+            self.generation += 1
+            self._last_frame = frame
+        return frame
+
+    def render_background(self, nametable, palette, pattern_table=0):
+        """
+        Draw a 32x30 nametable of tile numbers with a 4-entry RGB palette.
+        Pixels are gathered from tile_cache, so no CHR decoding happens per
+        frame, and land in frame32 as one packed uint32 store each.
+        """
+        if self.tile_cache is None or len(self.tile_cache) == 0:
+            return self._present(self._black, False)
+        # bytes() accepts every nametable form (bytes, bytearray, memoryview,
+        # uint8 array, list of ints), so all of them are read as uint8 the same way
+        tiles = np.frombuffer(bytes(nametable[:960]), dtype=np.uint8).astype(np.intp)
+        tiles = tiles.reshape(30, 32) + 256 * pattern_table
+        indices = self.tile_cache.take(tiles, axis=0, mode='wrap')  # (30, 32, 8, 8)
+        indices = indices.transpose(0, 2, 1, 3).reshape(SCREEN_HEIGHT, SCREEN_WIDTH)
+        rgb = np.asarray(palette, dtype='<u4')
+        packed = rgb[:, 0] | (rgb[:, 1] << 8) | (rgb[:, 2] << 16) | 0xFF000000
+        if self.frame32 is None:
+            self.frame32 = np.empty((SCREEN_HEIGHT, SCREEN_WIDTH), dtype='<u4')
+        np.take(packed, indices, out=self.frame32)
+        return self._present(self.frame32, True)
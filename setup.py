@@ -0,0 +1,15 @@
+"""
+Builds the optional compiled CPU core, used by cpu.py and memory.py when present:
+
+    python setup.py build_ext --inplace
+"""
+from setuptools import Extension, setup
+from Cython.Build import cythonize
+
+setup(
+    name="cpu_core",
+    ext_modules=cythonize(
+        Extension("cpu_core", ["cpu_core.pyx"], extra_compile_args=["-O3", "-march=native"]),
+        language_level=3,
+    ),
+)